@@ -0,0 +1,198 @@
+from typing import List, Dict
+import aiohttp
+import asyncio
+import time
+from .constants import BASE_API_URL, MAX_ITEMS_PER_PAGE
+from .models import Collection, Raindrop, Highlight, MAX_RETRIES, RETRY_STATUSES, _get_headers, _loads, _parse_retry_after
+
+
+MAX_CONCURRENT_REQUESTS = 64
+
+
+class _RateLimiter:
+    """
+    Pauses every request of a session once the Raindrop.io API reports
+    that the rate limit budget is exhausted (via `Retry-After` or
+    `X-RateLimit-Remaining`/`X-RateLimit-Reset`).
+    """
+    def __init__(self) -> None:
+        self._resume_at = 0.0
+
+    async def wait(self) -> None:
+        delay = self._resume_at - time.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def update(self, headers) -> None:
+        retry_after = headers.get('retry-after')
+        if retry_after is not None:
+            self._resume_at = max(self._resume_at, time.time() + _parse_retry_after(retry_after) + 1)
+        elif headers.get('x-ratelimit-remaining') == '0' and 'x-ratelimit-reset' in headers:
+            self._resume_at = max(self._resume_at, float(headers['x-ratelimit-reset']) + 1)
+
+
+async def fetch_response(http: aiohttp.ClientSession, limiter: _RateLimiter, semaphore: asyncio.Semaphore, url, params={}) -> bytes:
+    params = {key: value for key, value in params.items() if value is not None}
+    for attempt in range(MAX_RETRIES + 1):
+        await limiter.wait()
+        async with semaphore:
+            async with http.get(url, params=params) as response:
+                limiter.update(response.headers)
+                if response.status < 400:
+                    return await response.read()
+
+                if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    response.raise_for_status()
+                rate_limited = 'retry-after' in response.headers
+
+        # Sleep only after releasing the concurrency slot and the connection.
+        if rate_limited:
+            # The limiter holds the next attempt until `Retry-After` has passed.
+            print(f'PyRaindropIO - rate limited by Raindrop.io API. Retrying ({MAX_RETRIES - attempt} attempts left)...')
+        else:
+            wait = 0.5 * 2 ** attempt
+            print(f'PyRaindropIO - bad response recieved from Raindrop.io API. Retrying in {wait} seconds...')
+            await asyncio.sleep(wait)
+
+
+class AsyncSession:
+    """
+    asyncio counterpart of `Session`. Must be created from within a running
+    event loop and closed with `await session.close()` (or used as an
+    `async with` block).
+    """
+    def __init__(self, access_token: str, max_concurrent_requests: int=MAX_CONCURRENT_REQUESTS) -> None:
+        self._access_token = access_token
+        self._max_threads = max_concurrent_requests
+        self._collections: Dict['AsyncCollection'] = {}
+        self._headers = _get_headers(access_token)
+        self._http = aiohttp.ClientSession(
+            headers=self._headers,
+            connector=aiohttp.TCPConnector(limit=max_concurrent_requests, limit_per_host=max_concurrent_requests)
+        )
+        self._limiter = _RateLimiter()
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+    async def __aenter__(self) -> 'AsyncSession':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self._http.close()
+
+    async def _fetch(self, url, params={}) -> bytes:
+        return await fetch_response(self._http, self._limiter, self._semaphore, url=url, params=params)
+
+    async def get_collection_by_id(self, collection_id: int) -> 'AsyncCollection':
+        if collection_id not in self._collections:
+            data = _loads(await self._fetch(url=f"{BASE_API_URL}/collection/{collection_id}"))
+            collection_dict = data['item']
+            collection = AsyncCollection(collection_dict, session=self)
+            self._collections[collection_id] = collection
+
+        return self._collections[collection_id]
+
+
+class AsyncCollection(Collection):
+    __slots__ = ()
+
+    def __init__(self, collection_dict: dict, session: AsyncSession) -> None:
+        super().__init__(collection_dict, session=session)
+
+    async def _get_all_highlights(self) -> List[dict]:
+        highlights = []
+        page = 0
+        while True:
+            content = await self._attached_session._fetch(
+                url=self._highlights_url,
+                params={
+                    'page': page,
+                    'perpage': MAX_ITEMS_PER_PAGE
+                }
+            )
+            data = _loads(content)['items']
+            if len(data) == 0:
+                break
+            highlights.extend(data)
+            page += 1
+
+        return highlights
+
+    async def _get_raindrops_info_by_search(self, search_str: str = None) -> List[dict]:
+        pages = await asyncio.gather(*[
+            self._fetch_raindrops_page(search_str, page)
+            for page in range(0, self._page_count)
+        ])
+        return [raindrop_dict for raindrop_dicts in pages for raindrop_dict in raindrop_dicts]
+
+    async def fetch_all_raindrops(self) -> 'AsyncCollection':
+        raindrop_dicts, highlight_dicts = await asyncio.gather(
+            self._get_raindrops_info_by_search(),
+            self._get_all_highlights()
+        )
+        raindrops = {d['_id']: AsyncRaindrop(d, session=self._session) for d in raindrop_dicts}
+        for raindrop in raindrops.values():
+            raindrop._highlights = []
+        for highlight_dict in highlight_dicts:
+            raindrops[highlight_dict['raindropRef']]._highlights.insert(0, Highlight(highlight_dict))
+
+        self._raindrops = raindrops
+        return self
+
+    async def _fetch_raindrops_page(self, search_str: str, page: int) -> List[dict]:
+        content = await self._attached_session._fetch(
+            url=self._raindrops_url,
+            params={
+                'search': search_str,
+                'page': page,
+                'perpage': MAX_ITEMS_PER_PAGE
+            }
+        )
+        return _loads(content)['items']
+
+    async def search(self, search_str: str=None) -> List['AsyncRaindrop']:
+        raindrops = []
+        for raindrop_dict in await self._get_raindrops_info_by_search(search_str):
+            raindrop = self._raindrops.get(raindrop_dict['_id'])
+            if raindrop is None:
+                raindrop = AsyncRaindrop(raindrop_dict, session=self._session)
+                self._raindrops[raindrop.id] = raindrop
+            else:
+                raindrop.update_dict(raindrop_dict)
+            raindrops.append(raindrop)
+
+        if AsyncRaindrop.prefetch_highlights:
+            await asyncio.gather(*[raindrop.fetch_highlights() for raindrop in raindrops])
+        return raindrops
+
+    async def prefetch_highlights(self) -> 'AsyncCollection':
+        """
+        Fetches the highlights of every loaded raindrop concurrently. `search`
+        doesn't, unless `AsyncRaindrop.prefetch_highlights` is set.
+        """
+        await asyncio.gather(*[raindrop.fetch_highlights() for raindrop in list(self._raindrops.values())])
+        return self
+
+
+class AsyncRaindrop(Raindrop):
+    __slots__ = ()
+
+    def __init__(self, raindrop_dict: dict, session: AsyncSession) -> None:
+        super().__init__(raindrop_dict, session=session)
+
+    @property
+    def highlights(self) -> List['Highlight']:
+        # Highlights can't be fetched lazily from a property.
+        if self._highlights is None:
+            raise RuntimeError(
+                f'Highlights of raindrop {self.id} were not loaded; '
+                'await raindrop.fetch_highlights() or collection.prefetch_highlights() first.'
+            )
+        return self._highlights
+
+    async def fetch_highlights(self):
+        data = _loads(await self._attached_session._fetch(url=self._item_url()))
+        self._highlights = [Highlight(highlight_dict=highlight_dict) for highlight_dict in data['item']['highlights']]
+        return self
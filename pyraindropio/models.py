@@ -1,66 +1,303 @@
-from typing import Iterator, List, Dict
+from typing import Iterator, List, Dict, Optional
+from datetime import datetime
+from email.utils import parsedate_to_datetime
 import requests
-import math
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .constants import BASE_API_URL, MAX_ITEMS_PER_PAGE
 import concurrent.futures
+import importlib.util
+import itertools
+import sys
 import threading
 import time
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
 
-LOCK = threading.Lock()
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
-def _get_headers(access_token: str):
-    return {"Authorization": f"Bearer {access_token}"}
+# httpx needs h2 for HTTP/2, and urllib3/aiohttp need brotli to decode `br` encoded bodies.
+if importlib.util.find_spec('h2') is None:
+    httpx = None
 
+_ACCEPT_ENCODING = 'gzip' if importlib.util.find_spec('brotli') is None else 'gzip, br'
+
+
+MAX_RETRIES = 5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_print_lock = threading.Lock()
+
+
+def _intern(value):
+    # Fields like `domain` or `color` repeat across thousands of items; share one string object per value.
+    return sys.intern(value) if isinstance(value, str) else value
 
-def fetch_response(request, url, headers, params={}):
-    while True:
-        response = request(
-                url=url,
-                headers=headers,
-                params=params
-        )
-        if all([
-            'retry-after' not in response.headers,
-            response.status_code == 200
-        ]):
-            return response
-        
-        wait = response.headers.get('retry-after')
-        if wait is None:
-            wait = 10
-            msg = f'PyRaindropIO - bad response recieved from Raindrop.io API. Retrying in 10 seconds...'
-        else:
-            msg = f'PyRaindropIO - waiting {int(wait)} seconds for Raindrop.io API to allow more requests.'
-        with LOCK:
-            print(msg)
 
-        time.sleep(int(wait)+1)
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    if value is None:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+class _Model:
+    """
+    Shared base of `Collection` and `Raindrop`: lazily parsed timestamps and
+    pickling. The session (and with it the connection and access token) is
+    left out of pickles, so unpickled objects keep their data but can't issue
+    requests until `attach_session` is called.
+    """
+    created: str
+    last_update: str
+
+    __slots__ = ('_session', '_created_dt', '_last_update_dt', '__weakref__')
+
+    _UNPICKLED_SLOTS = ('_session', '__weakref__')
+
+    @property
+    def created_dt(self) -> Optional[datetime]:
+        if self._created_dt is None:
+            self._created_dt = _parse_datetime(self.created)
+        return self._created_dt
+
+    @property
+    def last_update_dt(self) -> Optional[datetime]:
+        if self._last_update_dt is None:
+            self._last_update_dt = _parse_datetime(self.last_update)
+        return self._last_update_dt
+
+    def __getstate__(self) -> dict:
+        return {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, '__slots__', ())
+            if name not in self._UNPICKLED_SLOTS and hasattr(self, name)
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self._session = None
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    @property
+    def _attached_session(self) -> 'Session':
+        if self._session is None:
+            raise RuntimeError(
+                f'{type(self).__name__} {self.id} is detached (unpickled); '
+                're-attach a Session with attach_session() before fetching from Raindrop.io API.'
+            )
+        return self._session
+
+    def attach_session(self, session: 'Session') -> None:
+        self._session = session
+
+
+DEFAULT_RETRY_AFTER = 10
+
+
+def _parse_retry_after(value: str) -> float:
+    """
+    Returns the number of seconds to wait for a `Retry-After` header, which is
+    either a number of seconds or an HTTP-date.
+    """
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+
+def _get_headers(access_token: str):
+    return {
+        "Authorization": f"Bearer {access_token}",
+        "Accept": "application/json",
+        "Accept-Encoding": _ACCEPT_ENCODING
+    }
+
+
+class _RateLimiter:
+    """
+    Token bucket shared by all threads of a session, refilled from the
+    `X-RateLimit-Remaining`/`X-RateLimit-Reset` (and `Retry-After`) headers
+    of the Raindrop.io API responses.
+    """
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._tokens = None  # Unknown until the first response arrives.
+        self._reset_at = 0.0
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self._tokens == 0:
+                delay = self._reset_at - time.time()
+                if delay <= 0:
+                    self._tokens = None
+                    break
+                self._condition.wait(delay)
+
+            if self._tokens is not None:
+                self._tokens -= 1
+
+    def update(self, headers) -> None:
+        with self._condition:
+            retry_after = headers.get('retry-after')
+            if retry_after is not None:
+                self._tokens = 0
+                self._reset_at = max(self._reset_at, time.time() + _parse_retry_after(retry_after))
+            else:
+                if 'x-ratelimit-remaining' in headers:
+                    self._tokens = int(headers['x-ratelimit-remaining'])
+                if 'x-ratelimit-reset' in headers:
+                    self._reset_at = float(headers['x-ratelimit-reset'])
+            self._condition.notify_all()
+
+
+class _Retry(Retry):
+    def increment(self, *args, **kwargs) -> Retry:
+        new_retry = super().increment(*args, **kwargs)
+        with _print_lock:
+            print(f'PyRaindropIO - bad response recieved from Raindrop.io API. Retrying ({new_retry.total} attempts left)...')
+        return new_retry
+
+
+def fetch_response(request, url, rate_limiter: _RateLimiter, params={}, stream: bool=False, headers=None):
+    # Retries and backoff (including `Retry-After` on 429) are handled by the session's transport.
+    # Only the requests transport can stream, so `stream` is passed along only when asked for.
+    rate_limiter.acquire()
+    response = request(
+            url=url,
+            params=params,
+            headers=headers,
+            **({'stream': True} if stream else {})
+    )
+    rate_limiter.update(response.headers)
+    if response.status_code >= 400:
+        # Raised the same way for every transport, so callers only need to catch `requests.HTTPError`.
+        response.close()
+        raise requests.HTTPError(f'{response.status_code} error from Raindrop.io API for url: {response.url}', response=response)
+    return response
+
+
+def _iter_items(response: requests.Response, streamed: bool=False) -> Iterator[dict]:
+    """
+    Yields the `items` of a page response. A `streamed` response (fetched with
+    `stream=True`, only done when ijson is installed) is parsed incrementally
+    off the socket, so the raw page is never held in memory at once.
+    """
+    if not streamed:
+        yield from _loads(response.content)['items']
+        return
+
+    try:
+        response.raw.decode_content = True
+        yield from ijson.items(response.raw, 'items.item', use_float=True)
+    finally:
+        response.close()
+
+
+class _Http2Client:
+    """
+    Exposes an HTTP/2 `httpx.Client` through the part of the `requests.Session`
+    interface used by `fetch_response`. Concurrent requests are multiplexed over
+    a single connection; servers that don't negotiate h2 are spoken to over
+    HTTP/1.1 transparently. Failed responses are retried like `_Retry` does for
+    the requests transport.
+    """
+    def __init__(self, headers: dict, max_connections: int) -> None:
+        # httpx ignores the client's own `http2`/`limits` once a transport is given; they belong here.
+        transport = httpx.HTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            retries=MAX_RETRIES
+        )
+        self._client = httpx.Client(headers=headers, transport=transport)
+        self.headers = self._client.headers
+
+    def get(self, url, params=None, headers=None) -> 'httpx.Response':
+        # httpx would send `None` params as empty strings.
+        params = {key: value for key, value in (params or {}).items() if value is not None}
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = self._client.get(url, params=params, headers=headers)
+            except httpx.TransportError as error:
+                # Surface connection failures as the same exception the requests transport raises.
+                raise requests.ConnectionError(str(error)) from error
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return response
+
+            retry_after = response.headers.get('retry-after')
+            wait = 0.5 * 2 ** attempt if retry_after is None else _parse_retry_after(retry_after)
+            response.close()
+            with _print_lock:
+                print(f'PyRaindropIO - bad response recieved from Raindrop.io API. Retrying ({MAX_RETRIES - attempt} attempts left)...')
+            time.sleep(wait)
 
 
 class Session:
-    def __init__(self, access_token: str, max_threads: int=4) -> None:
+    """
+    With `http2=True` (and httpx[http2] installed) requests are multiplexed over
+    a single HTTP/2 connection instead of a pool of HTTP/1.1 connections.
+    """
+    def __init__(self, access_token: str, max_threads: int=4, http2: bool=False) -> None:
         self._access_token = access_token
         self._max_threads = max_threads
         self._collections: Dict['Collection'] = {}
-        
+        self._headers = _get_headers(access_token)
+        if http2 and httpx is None:
+            with _print_lock:
+                print('PyRaindropIO - httpx[http2] is not installed, falling back to HTTP/1.1.')
+        if http2 and httpx is not None:
+            self._http = _Http2Client(self._headers, max_connections=max_threads)
+        else:
+            self._http = requests.Session()
+            self._http.headers.update(self._headers)
+            retry = _Retry(
+                total=MAX_RETRIES,
+                backoff_factor=0.5,
+                status_forcelist=RETRY_STATUSES,
+                raise_on_status=False,  # Let `fetch_response` raise `requests.HTTPError` like the HTTP/2 transport.
+                allowed_methods=frozenset(['GET']),
+                respect_retry_after_header=True
+            )
+            adapter = HTTPAdapter(pool_connections=max_threads, pool_maxsize=max_threads * 2, max_retries=retry)
+            self._http.mount('https://', adapter)
+            self._http.mount('http://', adapter)
+        self._rate_limiter = _RateLimiter()
+        # (collection id, search string, page) -> (ETag, ids of the raindrops on that page)
+        self._etags: Dict[tuple, tuple] = {}
+
+    def _fetch(self, url, params={}, stream: bool=False, headers=None) -> requests.Response:
+        return fetch_response(request=self._http.get, url=url, rate_limiter=self._rate_limiter, params=params, stream=stream, headers=headers)
+
     def get_collection_by_id(self, collection_id: int) -> 'Collection':
         if collection_id not in self._collections:
-            response = fetch_response(
-                request=requests.get,
-                url=f"{BASE_API_URL}/collection/{collection_id}",
-                headers=_get_headers(self._access_token)
-            )
-            data = response.json()
+            response = self._fetch(url=f"{BASE_API_URL}/collection/{collection_id}")
+            data = _loads(response.content)
             collection_dict = data['item']
-            collection = Collection(collection_dict, access_token=self._access_token, max_threads=self._max_threads)
+            collection = Collection(collection_dict, session=self)
             self._collections[collection_id] = collection
 
         return self._collections[collection_id]
 
 
-class Collection:
+class Collection(_Model):
     id: int
     access: dict
     color: str
@@ -78,82 +315,54 @@ class Collection:
     collaborators: bool
     raindrops: Dict[str, 'Raindrop']
 
-    def __init__(self, collection_dict: dict, access_token: str, max_threads: int) -> None:
-        self._dict = None
-        self._access_token = access_token
-        self._max_threads = max_threads
+    __slots__ = (
+        'id', 'access', 'color', 'count', 'cover', 'created', 'expanded', 'last_update', 'parent', 'public',
+        'sort', 'title', 'user', 'view', 'collaborators',
+        '_max_threads', '_raindrops', '_raindrops_url', '_highlights_url'
+    )
+
+    def __init__(self, collection_dict: dict, session: Session) -> None:
+        self._session = session
+        self._max_threads = session._max_threads
         self._raindrops = {}
         self.update_dict(collection_dict)
+        self._raindrops_url = f"{BASE_API_URL}/raindrops/{self.id}"
+        self._highlights_url = f"{BASE_API_URL}/highlights/{self.id}"
 
     def update_dict(self, new_collection_dict: dict) -> None:
-        self._dict = new_collection_dict
-
-    @property
-    def id(self) -> int:
-        return self._dict['_id']
-    
-    @property
-    def access(self) -> dict:
-        return self._dict['access']
-
-    @property
-    def color(self) -> str:
-        return self._dict['color']
-
-    @property
-    def count(self) -> int:
-        return self._dict['count']
-
-    @property
-    def cover(self) -> List[str]:
-        return self._dict['cover']
-
-    @property
-    def created(self) -> str:
-        return self._dict['created']
-
-    @property
-    def expanded(self) -> bool:
-        return self._dict['expanded']
-
-    @property
-    def last_update(self) -> str:
-        return self._dict['lastUpdate']
-
-    @property
-    def parent(self) -> dict:
-        return self._dict['parent']
-
-    @property
-    def public(self) -> bool:
-        return self._dict['public']
-
-    @property
-    def sort(self) -> int:
-        return self._dict['sort']
-
-    @property
-    def title(self) -> str:
-        return self._dict['title']
-
-    @property
-    def user(self) -> dict:
-        return self._dict['user']
-
-    @property
-    def view(self) -> str:
-        return self._dict['view']
-
-    @property
-    def collaborators(self) -> bool:
-        return self._dict.get('collaborators', False)
+        self.id = new_collection_dict['_id']
+        self.access = new_collection_dict.get('access')
+        self.color = new_collection_dict.get('color')
+        self.count = new_collection_dict['count']
+        self.cover = new_collection_dict.get('cover')
+        self.created = new_collection_dict.get('created')
+        self.expanded = new_collection_dict.get('expanded')
+        self.last_update = new_collection_dict.get('lastUpdate')
+        self.parent = new_collection_dict.get('parent')
+        self.public = new_collection_dict.get('public')
+        self.sort = new_collection_dict.get('sort')
+        self.title = new_collection_dict.get('title')
+        self.user = new_collection_dict.get('user')
+        self.view = new_collection_dict.get('view')
+        self.collaborators = new_collection_dict.get('collaborators', False)
+        self._created_dt = None
+        self._last_update_dt = None
 
     @property
     def raindrops(self) -> int:
         return self._raindrops
 
+    @property
+    def _page_count(self) -> int:
+        return (self.count + MAX_ITEMS_PER_PAGE - 1) // MAX_ITEMS_PER_PAGE
+
     def __iter__(self) -> Iterator['Raindrop']:
         return iter(self._raindrops.values())
+
+    def attach_session(self, session: 'Session') -> None:
+        super().attach_session(session)
+        for raindrop in self._raindrops.values():
+            raindrop.attach_session(session)
     
     def __getitem__(self, raindrop_id: int) -> 'Raindrop':
         return self._raindrops.get(raindrop_id)
@@ -162,16 +371,14 @@ class Collection:
         highlights = []
         page = 0
         while True:
-            response = fetch_response(
-                request=requests.get,
-                url=f"{BASE_API_URL}/highlights/{self.id}",
+            response = self._attached_session._fetch(
+                url=self._highlights_url,
                 params={
                     'page': page,
                     'perpage': MAX_ITEMS_PER_PAGE
-                },
-                headers=_get_headers(self._access_token)
+                }
             )
-            data = response.json()['items']
+            data = _loads(response.content)['items']
             if len(data) == 0:
                 break
             highlights.extend(data)
@@ -180,61 +387,127 @@ class Collection:
         return highlights
 
     def fetch_all_raindrops(self) -> None:
-        raindrops = {d['_id']: Raindrop(d, self._access_token) for d in self._get_raindrops_info_by_search()}
+        raindrops = {d['_id']: Raindrop(d, self._session) for d in self._get_raindrops_info_by_search()}
+        for raindrop in raindrops.values():
+            raindrop._highlights = []
         for highlight_dict in self._get_all_highlights():
             raindrops[highlight_dict['raindropRef']].highlights.insert(0, Highlight(highlight_dict))
         
         self._raindrops = raindrops
         return self
 
+    def prefetch_highlights(self) -> 'Collection':
+        """
+        Fetches the highlights of every loaded raindrop concurrently, over the
+        session's pooled connections. Prefer this to touching `highlights`
+        raindrop by raindrop, which fetches them one request at a time.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self._max_threads) as executor:
+            list(executor.map(lambda raindrop: raindrop.fetch_highlights(), list(self._raindrops.values())))
+
+        return self
+
+    def _fetch_raindrops_page(self, search_str: str, page: int, etag: str = None, stream: bool=False) -> requests.Response:
+        return self._attached_session._fetch(
+            url=self._raindrops_url,
+            params={
+                'search': search_str,
+                'page': page,
+                'perpage': MAX_ITEMS_PER_PAGE
+            },
+            stream=stream,
+            headers=None if etag is None else {'If-None-Match': etag}
+        )
+
     def _get_raindrops_info_by_search(self, search_str: str = None):
         raindrop_dicts = []
-        for page in range(0, math.ceil(self.count / MAX_ITEMS_PER_PAGE)):
-            response = fetch_response(
-                request=requests.get,
-                url=f"{BASE_API_URL}/raindrops/{self.id}",
-                params={
-                    'search': search_str,
-                    'page': page,
-                    'perpage': MAX_ITEMS_PER_PAGE
-                },
-                headers=_get_headers(self._access_token)
-            )
-            for raindrop_dict in response.json()['items']:
-                raindrop_dicts.append(raindrop_dict)
+        # Pages are fetched one at a time here, so streaming them keeps peak memory low at no cost.
+        # Only the requests transport exposes the raw socket stream ijson reads from.
+        stream = ijson is not None and isinstance(self._attached_session._http, requests.Session)
+        for page in range(0, self._page_count):
+            response = self._fetch_raindrops_page(search_str, page, stream=stream)
+            raindrop_dicts.extend(_iter_items(response, streamed=stream))
         
         return raindrop_dicts
 
     def search(self, search_str: str=None) -> Iterator['Raindrop']:
         def create_or_update_raindrop_from_raindrop_dict(raindrop_dict):
-            with LOCK:
-                raindrop = self._raindrops.get(raindrop_dict['_id'])
-
+            raindrop = self._raindrops.get(raindrop_dict['_id'])
             if raindrop is None:
-                raindrop = Raindrop(raindrop_dict, access_token=self._access_token)
+                # setdefault is atomic, so concurrent searches agree on a single instance per id.
+                new_raindrop = Raindrop(raindrop_dict, session=self._session)
+                raindrop = self._raindrops.setdefault(raindrop_dict['_id'], new_raindrop)
+                if raindrop is not new_raindrop:
+                    raindrop.update_dict(raindrop_dict)
             else:
                 raindrop.update_dict(raindrop_dict)
 
-            return raindrop.fetch_highlights()
+            return raindrop
+
+        def fetch_page(page):
+            # Bodies are read here, in the worker, so page downloads run in parallel and
+            # connections go back to the pool before the caller processes the items.
+            key = (self.id, search_str, page)
+            cached = self._attached_session._etags.get(key)
+            response = self._fetch_raindrops_page(search_str, page, etag=None if cached is None else cached[0])
+            return key, cached, response
         
+        pages = iter(range(0, self._page_count))
         with concurrent.futures.ThreadPoolExecutor(max_workers=self._max_threads) as executor:
-            futures = []
-            for raindrop_dict in self._get_raindrops_info_by_search(search_str):
-                futures.append(
-                    executor.submit(
-                        create_or_update_raindrop_from_raindrop_dict,
-                        raindrop_dict=raindrop_dict,
-                    )
-                )
-
-            for future in concurrent.futures.as_completed(futures):
-                raindrop = future.result()
-                with LOCK:
-                    self._raindrops[raindrop.id] = raindrop
-                yield raindrop
-
-
-class Raindrop:
+            def submit_next_pages(count):
+                return {executor.submit(fetch_page, page) for page in itertools.islice(pages, count)}
+
+            # Keep at most `max_threads` pages in flight; each finished page is replaced before its
+            # items are yielded so fetching overlaps with the caller's processing. `pending` holds
+            # every page not consumed yet, whether its request is done or not.
+            pending = submit_next_pages(self._max_threads)
+            try:
+                while pending:
+                    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for page_future in done:
+                        pending.discard(page_future)
+                        pending |= submit_next_pages(1)
+                        key, cached, response = page_future.result()
+                        try:
+                            if response.status_code == 304:
+                                # Page unchanged since the last search; reuse the raindrops built back then.
+                                for raindrop_id in cached[1]:
+                                    yield self._raindrops[raindrop_id]
+                                continue
+
+                            raindrops = map(create_or_update_raindrop_from_raindrop_dict, _iter_items(response))
+                            if Raindrop.prefetch_highlights:
+                                # Fetch the page's highlights in the pool rather than one by one in this thread.
+                                raindrops = list(raindrops)
+                                list(executor.map(Raindrop.fetch_highlights, raindrops))
+
+                            raindrop_ids = []
+                            for raindrop in raindrops:
+                                raindrop_ids.append(raindrop.id)
+                                yield raindrop
+
+                            etag = response.headers.get('ETag')
+                            if etag is not None:
+                                self._attached_session._etags[key] = (etag, raindrop_ids)
+                        finally:
+                            response.close()
+            finally:
+                # The caller may stop iterating early: skip pages that haven't started and release the rest.
+                for page_future in pending:
+                    page_future.cancel()
+                concurrent.futures.wait(pending)
+                for page_future in pending:
+                    if not page_future.cancelled() and page_future.exception() is None:
+                        page_future.result()[2].close()
+
+
+class Raindrop(_Model):
+    """
+    Highlights are taken from the raindrop payload when the API includes
+    them; otherwise they are fetched on first access of `highlights`.
+    Refreshing a raindrop with `update_dict` never issues a request. Use
+    `refresh_highlights()` to force a re-fetch.
+    """
     id: int
     collection: dict
     cover: str
@@ -250,85 +523,67 @@ class Raindrop:
     user: dict
     highlights: List['Highlight']
 
-    def __init__(self, raindrop_dict: dict, access_token: str) -> None:
-        self._dict = None
-        self._access_token = access_token
-        self._highlights = []
-        self.update_dict(raindrop_dict)
-
-    def update_dict(self, new_raindrop_dict: dict) -> None:
-        self._dict = new_raindrop_dict
-
-    @property
-    def id(self) -> int:
-        return self._dict['_id']
+    # When set, `Collection.search` fetches each raindrop's highlights eagerly
+    # instead of relying on the list payload / first access of `highlights`.
+    # Class-only flag: set it on `Raindrop` itself, instances use __slots__.
+    prefetch_highlights: bool = False
 
-    @property
-    def collection(self) -> str:
-        return self._dict['collection']
-    
-    @property
-    def cover(self) -> str:
-        return self._dict['cover']
+    __slots__ = (
+        'id', 'collection', 'cover', 'created', 'domain', 'excerpt', 'last_update', 'link', 'media', 'tags',
+        'title', 'type', 'user', '_highlights'
+    )
 
-    @property
-    def created(self) -> str:
-        return self._dict['created']
-
-    @property
-    def domain(self) -> str:
-        return self._dict['domain']
-
-    @property
-    def last_update(self) -> str:
-        return self._dict['lastUpdate']
-
-    @property
-    def link(self) -> str:
-        return self._dict['link']
-
-    @property
-    def media(self) -> List[dict]:
-        return self._dict['media']
-
-    @property
-    def tags(self) -> List[str]:
-        return self._dict['tags']
-
-    @property
-    def title(self) -> str:
-        return self._dict['title']
-
-    @property
-    def type(self) -> str:
-        return self._dict['type']
+    def __init__(self, raindrop_dict: dict, session: Session) -> None:
+        self._session = session
+        self._highlights = None
+        self.update_dict(raindrop_dict)
 
-    @property
-    def user(self) -> dict:
-        return self._dict['user']
+    def update_dict(self, new_raindrop_dict: dict) -> None:
+        self.id = new_raindrop_dict['_id']
+        self.collection = new_raindrop_dict.get('collection')
+        self.cover = new_raindrop_dict.get('cover')
+        self.created = new_raindrop_dict.get('created')
+        self.domain = _intern(new_raindrop_dict.get('domain'))
+        self.excerpt = new_raindrop_dict.get('excerpt')
+        self.last_update = new_raindrop_dict.get('lastUpdate')
+        self.link = new_raindrop_dict.get('link')
+        self.media = new_raindrop_dict.get('media')
+        self.tags = new_raindrop_dict.get('tags')
+        self.title = new_raindrop_dict.get('title')
+        self.type = _intern(new_raindrop_dict.get('type'))
+        self.user = new_raindrop_dict.get('user')
+        highlight_dicts = new_raindrop_dict.get('highlights')
+        if highlight_dicts is not None:
+            self._highlights = [Highlight(highlight_dict=highlight_dict) for highlight_dict in highlight_dicts]
+        self._created_dt = None
+        self._last_update_dt = None
 
     @property
     def highlights(self) -> List['Highlight']:
+        if self._highlights is None:
+            self.fetch_highlights()
         return self._highlights
 
     def __iter__(self) -> Iterator['Highlight']:
-        return iter(self._highlights)
+        return iter(self.highlights)
+
+    def _item_url(self) -> str:
+        return f"{BASE_API_URL}/raindrop/{self.id}"
 
     def fetch_highlights(self):
-        self._highlights = []
-        response = fetch_response(
-            request=requests.get,
-            url=f"{BASE_API_URL}/raindrop/{self.id}",
-            headers=_get_headers(self._access_token)
+        response = self._attached_session._fetch(
+            url=self._item_url()
         )
-        data = response.json()
-
-        for highlight_dict in data['item']['highlights']:
-            highlight = Highlight(highlight_dict=highlight_dict)
-            self._highlights.append(highlight)
+        data = _loads(response.content)
 
+        # Publish the list only once it's complete, so a failed fetch is retried on the next access
+        # and other threads never observe a partially built list.
+        self._highlights = [Highlight(highlight_dict=highlight_dict) for highlight_dict in data['item']['highlights']]
         return self
 
+    def refresh_highlights(self):
+        return self.fetch_highlights()
+
         
 class Highlight:
     id: int
@@ -337,31 +592,17 @@ class Highlight:
     note: str
     created: str
 
+    __slots__ = ('id', 'text', 'color', 'note', 'created')
+
     def __init__(self, highlight_dict: dict) -> None:
-        self._highlight_dict = highlight_dict
+        self.update_dict(highlight_dict)
 
     def update_dict(self, new_highlight_dict: dict) -> None:
-        self._highlight_dict = new_highlight_dict
-
-    @property
-    def id(self) -> int:
-        return self._highlight_dict['_id']
-
-    @property
-    def text(self) -> int:
-        return self._highlight_dict['text']
-
-    @property
-    def color(self) -> int:
-        return self._highlight_dict.get('color', 'yellow')  # BUG? Why is this missing for some highlights?
-
-    @property
-    def note(self) -> int:
-        return self._highlight_dict['note']
-
-    @property
-    def created(self) -> int:
-        return self._highlight_dict['created']
+        self.id = new_highlight_dict['_id']
+        self.text = new_highlight_dict.get('text')
+        self.color = _intern(new_highlight_dict.get('color', 'yellow'))  # BUG? Why is this missing for some highlights?
+        self.note = new_highlight_dict.get('note')
+        self.created = new_highlight_dict.get('created')
 
     def __repr__(self) -> str:
         return f"Highlight(id={self.id}, created={self.created})"
@@ -8,5 +8,12 @@ setup(
       author='Almog Tzabari',
       author_email='almog@tzabari.com',
       url='https://github.com/almogtzabari/PyRaindropIO',
-      install_requires=['requests'],
+      install_requires=['requests', 'urllib3>=1.26'],
+      extras_require={
+          'fast': ['orjson'],
+          'async': ['aiohttp'],
+          'streaming': ['ijson'],
+          'brotli': ['brotli'],
+          'http2': ['httpx[http2]'],
+      },
      )
@@ -0,0 +1,338 @@
+import asyncio
+import http.server
+import json
+import pickle
+import threading
+import time
+import unittest
+import urllib.parse
+from email.utils import formatdate
+from unittest import mock
+
+import requests
+
+import pyraindropio
+from pyraindropio import models
+
+try:
+    import aiohttp
+    from pyraindropio import async_models
+except ImportError:
+    async_models = None
+
+
+COLLECTION_ID = 1
+RAINDROPS_COUNT = 230
+
+
+class FakeRaindropAPI(http.server.BaseHTTPRequestHandler):
+    """
+    Minimal stand-in for the Raindrop.io endpoints used by `Collection.search`.
+    Pages carry an ETag derived from the page number and search string.
+    """
+    protocol_version = 'HTTP/1.1'
+    page_delay = 0.0
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _send_json(self, body: dict, headers: dict = {}) -> None:
+        content = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_GET(self) -> None:
+        server = self.server
+        url = urllib.parse.urlparse(self.path)
+        query = dict(urllib.parse.parse_qsl(url.query))
+
+        if url.path == '/collection/503':
+            with server.lock:
+                server.unavailable += 1
+            self.send_response(503)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        if url.path == f'/collection/{COLLECTION_ID}':
+            return self._send_json({'item': {'_id': COLLECTION_ID, 'count': RAINDROPS_COUNT, 'title': 'Test'}})
+
+        if url.path == f'/raindrops/{COLLECTION_ID}':
+            page = int(query['page'])
+            search_str = query.get('search', '')
+            etag = f'"{page}-{search_str}"'
+            with server.lock:
+                server.page_requests.append((page, search_str))
+                server.in_flight += 1
+                server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            try:
+                time.sleep(self.page_delay)
+                if self.headers.get('If-None-Match') == etag:
+                    with server.lock:
+                        server.not_modified += 1
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                first = page * models.MAX_ITEMS_PER_PAGE
+                last = min(RAINDROPS_COUNT, first + models.MAX_ITEMS_PER_PAGE)
+                items = [{'_id': raindrop_id, 'title': f'{search_str}{raindrop_id}'} for raindrop_id in range(first, last)]
+                return self._send_json({'items': items}, headers={'ETag': etag})
+            finally:
+                with server.lock:
+                    server.in_flight -= 1
+
+        if url.path == f'/highlights/{COLLECTION_ID}':
+            page = int(query['page'])
+            items = [{'_id': 'h0', 'raindropRef': 0, 'text': 'text', 'note': '', 'created': '2021-01-01T00:00:00Z'}]
+            return self._send_json({'items': items if page == 0 else []})
+
+        if url.path.startswith('/raindrop/'):
+            raindrop_id = int(url.path.rsplit('/', 1)[1])
+            with server.lock:
+                server.item_requests.append(raindrop_id)
+            highlights = [{'_id': f'h{raindrop_id}', 'text': 'text', 'note': '', 'created': '2021-01-01T00:00:00Z'}]
+            return self._send_json({'item': {'_id': raindrop_id, 'highlights': highlights}})
+
+        self.send_response(404)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+class OfflineTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), FakeRaindropAPI)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.page_requests = []
+        self.server.item_requests = []
+        self.server.in_flight = 0
+        self.server.max_in_flight = 0
+        self.server.not_modified = 0
+        self.server.unavailable = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        base_url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        patcher = mock.patch.object(models, 'BASE_API_URL', base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def get_collection(self, max_threads: int = 4, http2: bool = False) -> pyraindropio.Collection:
+        session = pyraindropio.Session(access_token='test-token', max_threads=max_threads, http2=http2)
+        return session.get_collection_by_id(COLLECTION_ID)
+
+
+class SearchTester(OfflineTestCase):
+    def test_search_yields_every_raindrop_once(self):
+        collection = self.get_collection()
+        ids = [raindrop.id for raindrop in collection.search()]
+        self.assertEqual(sorted(ids), list(range(RAINDROPS_COUNT)))
+        self.assertEqual(len(collection.raindrops), RAINDROPS_COUNT)
+
+    def test_unchanged_pages_reuse_cached_raindrops(self):
+        collection = self.get_collection()
+        first = {raindrop.id: raindrop for raindrop in collection.search()}
+        second = {raindrop.id: raindrop for raindrop in collection.search()}
+
+        pages = len(set(page for page, _ in self.server.page_requests))
+        self.assertEqual(self.server.not_modified, pages)
+        self.assertEqual(first.keys(), second.keys())
+        for raindrop_id, raindrop in second.items():
+            self.assertIs(raindrop, first[raindrop_id])
+
+    def test_etags_are_keyed_by_search_string(self):
+        collection = self.get_collection()
+        list(collection.search('a'))
+        raindrops = list(collection.search('b'))
+
+        self.assertEqual(self.server.not_modified, 0)
+        self.assertTrue(all(raindrop.title.startswith('b') for raindrop in raindrops))
+
+    def test_in_flight_pages_are_bounded_by_max_threads(self):
+        with mock.patch.object(FakeRaindropAPI, 'page_delay', 0.05):
+            collection = self.get_collection(max_threads=2)
+            list(collection.search())
+
+        self.assertLessEqual(self.server.max_in_flight, 2)
+        self.assertGreater(self.server.max_in_flight, 1)
+
+    def test_abandoned_search_stops_fetching_pages(self):
+        with mock.patch.object(FakeRaindropAPI, 'page_delay', 0.05):
+            collection = self.get_collection(max_threads=2)
+            results = collection.search()
+            next(results)
+            results.close()
+
+        # The window (2) plus the page submitted when the first one completed.
+        self.assertLessEqual(len(self.server.page_requests), 3)
+        self.assertEqual(len(collection.raindrops), 1)
+
+
+    def test_highlights_are_fetched_lazily(self):
+        collection = self.get_collection()
+        raindrops = list(collection.search())
+        self.assertEqual(self.server.item_requests, [])
+
+        self.assertEqual(raindrops[0].highlights[0].id, f'h{raindrops[0].id}')
+        self.assertEqual(self.server.item_requests, [raindrops[0].id])
+
+    def test_prefetch_flag_fetches_highlights_during_search(self):
+        with mock.patch.object(pyraindropio.Raindrop, 'prefetch_highlights', True):
+            collection = self.get_collection()
+            raindrops = list(collection.search())
+
+        self.assertEqual(sorted(self.server.item_requests), list(range(RAINDROPS_COUNT)))
+        self.assertTrue(all(raindrop._highlights for raindrop in raindrops))
+
+
+class FetchAllTester(OfflineTestCase):
+    def check_fetch_all_raindrops(self, http2: bool):
+        collection = self.get_collection(http2=http2).fetch_all_raindrops()
+        self.assertEqual(sorted(collection.raindrops), list(range(RAINDROPS_COUNT)))
+        self.assertEqual([highlight.id for highlight in collection[0].highlights], ['h0'])
+        self.assertEqual(collection[1].highlights, [])
+        self.assertEqual(self.server.item_requests, [])
+
+    def test_fetch_all_raindrops(self):
+        self.check_fetch_all_raindrops(http2=False)
+
+    @unittest.skipIf(models.httpx is None, 'httpx[http2] is not installed')
+    def test_fetch_all_raindrops_over_http2(self):
+        self.check_fetch_all_raindrops(http2=True)
+
+
+class ErrorTester(OfflineTestCase):
+    def check_errors(self, http2: bool):
+        with mock.patch.object(models, 'MAX_RETRIES', 1):
+            session = pyraindropio.Session(access_token='test-token', http2=http2)
+            with self.assertRaises(requests.HTTPError) as context:
+                session.get_collection_by_id(404)
+            self.assertEqual(context.exception.response.status_code, 404)
+
+            with self.assertRaises(requests.HTTPError) as context:
+                session.get_collection_by_id(503)
+            self.assertEqual(context.exception.response.status_code, 503)
+            self.assertEqual(self.server.unavailable, 2)
+
+    def test_errors(self):
+        self.check_errors(http2=False)
+
+    @unittest.skipIf(models.httpx is None, 'httpx[http2] is not installed')
+    def test_errors_over_http2(self):
+        self.check_errors(http2=True)
+
+
+@unittest.skipIf(async_models is None, 'aiohttp is not installed')
+class AsyncTester(OfflineTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        patcher = mock.patch.object(async_models, 'BASE_API_URL', models.BASE_API_URL)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_with_collection(self, check):
+        async def main():
+            async with async_models.AsyncSession(access_token='test-token', max_concurrent_requests=4) as session:
+                return await check(await session.get_collection_by_id(COLLECTION_ID))
+
+        return asyncio.run(main())
+
+    def test_search_leaves_highlights_to_prefetch(self):
+        async def check(collection):
+            raindrops = await collection.search()
+            self.assertEqual(sorted(raindrop.id for raindrop in raindrops), list(range(RAINDROPS_COUNT)))
+            self.assertEqual(self.server.item_requests, [])
+            with self.assertRaises(RuntimeError):
+                raindrops[0].highlights
+
+            await collection.prefetch_highlights()
+            self.assertEqual(len(self.server.item_requests), RAINDROPS_COUNT)
+            self.assertEqual(raindrops[0].highlights[0].id, f'h{raindrops[0].id}')
+
+        self.run_with_collection(check)
+
+    def test_fetch_all_raindrops(self):
+        async def check(collection):
+            await collection.fetch_all_raindrops()
+            self.assertEqual(sorted(collection.raindrops), list(range(RAINDROPS_COUNT)))
+            self.assertEqual([highlight.id for highlight in collection[0].highlights], ['h0'])
+            self.assertEqual(collection[1].highlights, [])
+
+        self.run_with_collection(check)
+
+    def test_error_status_raises(self):
+        async def main():
+            async with async_models.AsyncSession(access_token='test-token') as session:
+                await session.get_collection_by_id(404)
+
+        with self.assertRaises(aiohttp.ClientResponseError) as context:
+            asyncio.run(main())
+        self.assertEqual(context.exception.status, 404)
+
+
+class RateLimiterTester(unittest.TestCase):
+    def test_acquire_spends_remaining_tokens(self):
+        limiter = models._RateLimiter()
+        limiter.update({'x-ratelimit-remaining': '2', 'x-ratelimit-reset': str(time.time() + 60)})
+        start = time.time()
+        limiter.acquire()
+        limiter.acquire()
+        self.assertLess(time.time() - start, 0.1)
+        self.assertEqual(limiter._tokens, 0)
+
+    def test_acquire_waits_for_reset_when_exhausted(self):
+        limiter = models._RateLimiter()
+        limiter.update({'x-ratelimit-remaining': '0', 'x-ratelimit-reset': str(time.time() + 0.3)})
+        start = time.time()
+        limiter.acquire()
+        self.assertGreaterEqual(time.time() - start, 0.25)
+
+    def test_retry_after_accepts_seconds_and_http_dates(self):
+        self.assertEqual(models._parse_retry_after('3'), 3)
+        self.assertAlmostEqual(models._parse_retry_after(formatdate(time.time() + 60, usegmt=True)), 60, delta=2)
+        self.assertEqual(models._parse_retry_after('soon'), models.DEFAULT_RETRY_AFTER)
+
+
+class PickleTester(unittest.TestCase):
+    def test_round_trip_drops_session_and_token(self):
+        session = pyraindropio.Session(access_token='secret-token')
+        collection = pyraindropio.Collection({'_id': 1, 'count': 1, 'created': '2021-01-01T00:00:00Z'}, session)
+        raindrop = pyraindropio.Raindrop({'_id': 2, 'title': 'title', 'highlights': [{'_id': 3, 'text': 'text'}]}, session)
+        collection.raindrops[raindrop.id] = raindrop
+
+        data = pickle.dumps(collection)
+        self.assertNotIn(b'secret-token', data)
+
+        restored = pickle.loads(data)
+        self.assertEqual(restored.created_dt, collection.created_dt)
+        self.assertIsNone(restored._session)
+        self.assertEqual(restored[2].title, 'title')
+        self.assertEqual(restored[2].highlights[0].text, 'text')
+
+    def test_detached_object_raises_until_reattached(self):
+        session = pyraindropio.Session(access_token='secret-token')
+        collection = pyraindropio.Collection({'_id': 1, 'count': 1}, session)
+        collection.raindrops[2] = pyraindropio.Raindrop({'_id': 2, 'title': 'title'}, session)
+
+        restored = pickle.loads(pickle.dumps(collection))
+        with self.assertRaisesRegex(RuntimeError, 'detached'):
+            restored[2].highlights
+        with self.assertRaisesRegex(RuntimeError, 'detached'):
+            restored.fetch_all_raindrops()
+
+        restored.attach_session(session)
+        self.assertIs(restored._session, session)
+        self.assertIs(restored[2]._session, session)
+
+
+if __name__ == '__main__':
+    unittest.main()